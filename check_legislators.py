@@ -4,68 +4,75 @@ Colorado Legislator Data Validator
 This script validates the integrity and completeness of the legislators.json file.
 It performs various checks to ensure data quality and consistency.
 
+Performance notes: unlike legs.py this is CPU-bound, but the dataset is tiny
+and the whole run is dominated by interpreter start-up. As the data grows the
+cost is in walking the decoded records, so the useful levers are fewer passes
+over the data (one decode, C-level string checks) and, for very large files,
+spreading the records across processes. Heavier machinery (pandas, Numba,
+regex DFAs) costs more to load than it would save at this size.
+
 Author: Your Name
 Version: 1.0
-Dependencies: json, re
+Dependencies: orjson
 """
 
-import json
+import itertools
+import mmap
+import multiprocessing
+import orjson
+import os
 import sys
-import re
 
-def validate_legislators_data():
+URL_PREFIXES = ('http://', 'https://')  # Valid URL format
+
+# Records needed before validating in worker processes. This is an unmeasured
+# guess: no multi-core timing has been done. At 100k records serial validation
+# takes ~0.08s against ~0.6s for decoding the file, so the parallel path saves
+# at most tens of milliseconds and may not cover the pool start-up cost.
+# Re-measure with check_parallel_validation.py on a multi-core machine before
+# relying on it.
+PARALLEL_THRESHOLD = 100000
+CHUNK_SIZE = 10000           # Records per worker task
+
+# Dataset shared with forked worker processes. Workers inherit it from the
+# parent, so only index ranges and the (few) errors cross process boundaries;
+# pickling the records themselves would cost more than validating them.
+_shared_records = None
+
+def validate_records(records, start=0):
     """
-    Validates the legislators.json file for data integrity and completeness.
-    
-    This function performs comprehensive validation checks on the legislator data:
-    - Ensures all required fields are present and non-blank
-    - Validates data types and formats
-    - Checks for ASCII compliance in text fields
-    - Verifies URL format for links
-    - Ensures proper structure for committees and counties
-    
+    Validates a run of legislator records.
+
+    Args:
+        records (list of dict): Legislator records to check
+        start (int): Index of the first record within the full dataset
+
     Returns:
         list: List of tuples containing (index, name, errors) for each legislator with issues
-        
-    Raises:
-        FileNotFoundError: If legislators.json doesn't exist
-        json.JSONDecodeError: If the JSON file is malformed
     """
-    
-    # Load legislators.json
-    try:
-        with open('legislators.json', 'r') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print("Error: legislators.json not found. Run legs.py first to generate the data.")
-        return []
-    except json.JSONDecodeError as e:
-        print(f"Error: legislators.json is not valid JSON: {e}")
-        return []
-
-    # Compile regex patterns for validation
-    ascii_re = re.compile(r'^[\x00-\x7F]+$')  # ASCII-only characters
-    url_re = re.compile(r'^https?://')        # Valid URL format
-
     errors = []
 
-    # Validate each legislator record
-    for i, leg in enumerate(data):
+    # Validate each legislator record. Each field is fetched from the record
+    # once into a local, and exact type checks are used since the data comes
+    # straight from the JSON decoder.
+    for i, leg in enumerate(records, start):
         leg_errors = []
         
         # District: must be numeric and not blank
-        if not leg.get('District') or not str(leg['District']).isdigit():
+        district = leg.get('District')
+        if not district or not str(district).isdigit():
             leg_errors.append('District is blank or not numeric')
         
         # Chamber: must be Senate or House
-        if leg.get('Chamber') not in ('Senate', 'House'):
-            leg_errors.append(f"Chamber is invalid: {leg.get('Chamber')}")
+        chamber = leg.get('Chamber')
+        if chamber not in ('Senate', 'House'):
+            leg_errors.append(f"Chamber is invalid: {chamber}")
         
         # Name: must be non-blank and ASCII
         name = leg.get('Name', '')
         if not name:
             leg_errors.append('Name is blank')
-        elif not ascii_re.match(name):
+        elif not name.isascii():
             leg_errors.append('Name is not ASCII')
         
         # Party: must be non-blank
@@ -74,25 +81,25 @@ def validate_legislators_data():
         
         # Link: must be non-blank and look like a URL
         link = leg.get('Link', '')
-        if not link or not url_re.match(link):
+        if not link or not link.startswith(URL_PREFIXES):
             leg_errors.append('Link is blank or not a valid URL')
         
         # Committees: must be a list of dicts with non-blank name
         committees = leg.get('Committees', [])
-        if not isinstance(committees, list):
+        if type(committees) is not list:
             leg_errors.append('Committees is not a list')
         else:
             for c in committees:
-                if not isinstance(c, dict) or not c.get('name'):
+                if type(c) is not dict or not c.get('name'):
                     leg_errors.append('Committee entry missing name or not a dict')
         
         # Counties: must be a non-empty list of ASCII strings
         counties = leg.get('Counties', [])
-        if not isinstance(counties, list) or not counties:
+        if type(counties) is not list or not counties:
             leg_errors.append('Counties is not a non-empty list')
         else:
             for county in counties:
-                if not county or not ascii_re.match(county):
+                if not county or not county.isascii():
                     leg_errors.append(f'County name not ASCII or blank: {county}')
         
         # Add this legislator's errors to the main error list
@@ -101,13 +108,85 @@ def validate_legislators_data():
 
     return errors
 
+def _validate_range(start, stop):
+    """
+    Worker entry point: validates records[start:stop] of the shared dataset.
+    """
+    return validate_records(_shared_records[start:stop], start)
+
+def validate_records_parallel(records):
+    """
+    Validates records across forked worker processes.
+
+    The records are split into CHUNK_SIZE index ranges; results come back in
+    order, so the output matches validate_records(records).
+
+    Args:
+        records (list of dict): Legislator records to check
+
+    Returns:
+        list: List of tuples containing (index, name, errors) for each legislator with issues
+    """
+    global _shared_records
+
+    _shared_records = records
+    try:
+        chunks = [(start, start + CHUNK_SIZE)
+                  for start in range(0, len(records), CHUNK_SIZE)]
+        processes = min(os.cpu_count() or 1, len(chunks))
+        with multiprocessing.get_context('fork').Pool(processes=processes) as pool:
+            return list(itertools.chain.from_iterable(pool.starmap(_validate_range, chunks)))
+    finally:
+        _shared_records = None
+
+def validate_legislators_data():
+    """
+    Validates the legislators.json file for data integrity and completeness.
+    
+    This function performs comprehensive validation checks on the legislator data:
+    - Ensures all required fields are present and non-blank
+    - Validates data types and formats
+    - Checks for ASCII compliance in text fields
+    - Verifies URL format for links
+    - Ensures proper structure for committees and counties
+    
+    Returns:
+        tuple: (errors, total) where errors is a list of tuples containing
+            (index, name, errors) for each legislator with issues and total is
+            the number of legislators validated (0 if the file couldn't be loaded)
+    """
+    
+    # Load legislators.json, decoding straight from a memory map of the file
+    try:
+        with open('legislators.json', 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf, \
+                memoryview(buf) as view:
+            data = orjson.loads(view)
+    except FileNotFoundError:
+        print("Error: legislators.json not found. Run legs.py first to generate the data.")
+        return [], 0
+    except ValueError as e:  # orjson.JSONDecodeError, or an empty file that can't be mapped
+        print(f"Error: legislators.json is not valid JSON: {e}")
+        return [], 0
+
+    # Small datasets are validated in-process; large ones are split into
+    # chunks and spread across forked worker processes when there are cores
+    # to use.
+    if (len(data) < PARALLEL_THRESHOLD or (os.cpu_count() or 1) < 2
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        errors = validate_records(data)
+    else:
+        errors = validate_records_parallel(data)
+
+    return errors, len(data)
+
 def main():
     """
     Main function to run the validation and display results.
     """
     print("Validating legislators.json...")
     
-    errors = validate_legislators_data()
+    errors, total = validate_legislators_data()
     
     if errors:
         print(f'\nValidation errors found ({len(errors)} legislators with issues):')
@@ -117,9 +196,9 @@ def main():
             for err in errs:
                 print(f'  - {err}')
             print()
-    else:
+    elif total:
         print('✅ All legislators passed validation.')
-        print(f'Total legislators validated: {len(json.load(open("legislators.json")))}')
+        print(f'Total legislators validated: {total}')
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Parallel Validation Check
+
+This script exercises the multi-process path of check_legislators.py, which
+only runs for datasets far larger than the real legislators.json. It builds a
+synthetic dataset by repeating the records in legislators.json, breaks some of
+them, and checks that the parallel validator reports exactly the same errors
+as the serial one.
+
+Author: Your Name
+Version: 1.0
+Dependencies: orjson
+"""
+
+import copy
+import multiprocessing
+import orjson
+import sys
+import time
+
+from check_legislators import PARALLEL_THRESHOLD, validate_records, validate_records_parallel
+
+def build_dataset(size):
+    """
+    Builds a synthetic dataset from legislators.json with some invalid records.
+
+    Args:
+        size (int): Number of records to generate
+
+    Returns:
+        list of dict: Legislator records, roughly one in 500 of them invalid
+    """
+    with open('legislators.json', 'rb') as f:
+        template = orjson.loads(f.read())
+
+    data = [copy.deepcopy(template[i % len(template)]) for i in range(size)]
+    for i in range(0, size, 997):
+        data[i]['District'] = ''
+    for i in range(500, size, 1009):
+        data[i]['Name'] = data[i]['Name'] + ' é'
+        data[i]['Counties'] = data[i]['Counties'] + ['']
+    return data
+
+def main():
+    """
+    Main function to compare the serial and parallel validators.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        print('Skipped: the parallel validator needs the fork start method.')
+        return
+
+    data = build_dataset(PARALLEL_THRESHOLD)
+    print(f'Validating {len(data)} synthetic records serially and in parallel...')
+
+    start = time.perf_counter()
+    serial_errors = validate_records(data)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel_errors = validate_records_parallel(data)
+    parallel_time = time.perf_counter() - start
+
+    print(f'Serial:   {len(serial_errors)} legislators with issues in {serial_time:.2f}s')
+    print(f'Parallel: {len(parallel_errors)} legislators with issues in {parallel_time:.2f}s')
+
+    if not serial_errors:
+        print('❌ The invalid synthetic records were not reported.')
+        sys.exit(1)
+    if parallel_errors != serial_errors:
+        print('❌ Parallel validation results differ from serial validation.')
+        sys.exit(1)
+    print('✅ Parallel validation matches serial validation.')
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,211 @@ This script fetches current legislator information from the Colorado Legislature
 and outputs it as structured JSON data. It includes district information, party affiliation,
 committee assignments, and counties served for each legislator.
 
+Performance notes: the run time is dominated by waiting on the network for
+~100 detail pages, not by the CPU. Speedups come from overlapping requests
+(the thread pool), not making them at all (the on-disk cache and fetching
+each distinct detail link once), and parsing less (lxml with precompiled
+XPath). CPU-level work such as vectorizing or JIT-compiling the parsing code
+won't make a visible difference while the process is mostly idle waiting for
+responses.
+
 Author: Your Name
 Version: 1.0
-Dependencies: requests, beautifulsoup4, pandas
+Dependencies: requests, requests-cache, lxml, orjson
 """
 
 import requests
-from bs4 import BeautifulSoup, Tag
-import pandas as pd # Using pandas for easy table creation and display
-import json
+import requests_cache
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
+import gzip
+import orjson
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Detail pages are fetched concurrently; these settings keep the load on the
+# legislature's server polite while overlapping network latency.
+MAX_WORKERS = 8           # Concurrent detail-page requests
+REQUESTS_PER_SECOND = 5   # Shared rate limit across all worker threads
+RATE_LIMIT_BURST = 1      # Requests allowed back to back before the limit applies
+REQUEST_TIMEOUT = 10      # Seconds to wait for a response
+CACHE_NAME = 'legs_cache' # On-disk (SQLite) cache of fetched pages
+CACHE_EXPIRE_AFTER = 86400  # Seconds before a cached page is refetched
+
+# XPath expressions for the scraped pages, compiled once rather than per page
+# or per row. The class tests match a whole class token, like a CSS selector.
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Main legislators table; the cell expressions are evaluated per row/cell.
+XP_TABLE = etree.XPath("//table[@id='legislators-overview-table']")
+XP_ROWS = etree.XPath("tbody[1]/tr")
+XP_CELLS = etree.XPath("td")
+XP_LINK = etree.XPath("(.//a)[1]")
+XP_FIELD_CONTENT = etree.XPath(f"(.//div[{_has_class('field-content')}])[1]")
+
+# Committee blocks and county items are found together in a single pass over
+# the page and told apart by their class.
+XP_DETAIL = etree.XPath(
+    f"//*[{_has_class('committee-assignment')}]"
+    f" | //*[{_has_class('field-name-field-counties')}]//*[{_has_class('field-item')}]")
+XP_CNAME = etree.XPath(f".//*[{_has_class('committee-link')}]//a")
+XP_ROLE = etree.XPath(f".//*[{_has_class('committee-role')}]//span")
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter shared by the detail-page worker threads.
+
+    Args:
+        rate (float): Tokens added per second (sustained requests per second)
+        capacity (int): Maximum number of tokens (burst size)
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a token is available, then consumes it.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def create_session():
+    """
+    Creates a caching HTTP session with a connection pool sized for the worker threads.
+
+    Responses are stored on disk so that repeated runs don't refetch pages that
+    haven't expired; Cache-Control and ETag headers from the server are honored.
+
+    Returns:
+        requests_cache.CachedSession: Session that reuses keep-alive connections
+            and cached responses across requests
+    """
+    session = requests_cache.CachedSession(CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER,
+                                           cache_control=True)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def parse_html(response):
+    """
+    Parses an HTML response into an lxml tree.
+
+    The raw bytes are handed to libxml2 so it can honor the page's own
+    <meta charset>; a charset declared in the Content-Type header wins.
+
+    Args:
+        response (requests.Response): Response holding an HTML page
+
+    Returns:
+        lxml.html.HtmlElement: Root element of the parsed document
+    """
+    parser = None
+    if 'charset' in response.headers.get('content-type', '').lower():
+        parser = lxml.html.HTMLParser(encoding=response.encoding)
+    return lxml.html.fromstring(response.content, parser=parser)
+
+def is_cached(session, link):
+    """
+    Checks whether a GET for the URL would be answered from the cache.
+
+    An entry that exists but has expired doesn't count, since requesting it
+    still goes to the server (to refetch or revalidate it).
+
+    Args:
+        session (requests_cache.CachedSession): Shared HTTP session
+        link (str): URL to look up
+
+    Returns:
+        bool: True if a fresh response for the URL is cached
+    """
+    key = session.cache.create_key(requests.Request('GET', link))
+    cached_response = session.cache.get_response(key)
+    return cached_response is not None and not cached_response.is_expired
+
+def parse_detail(session, limiter, link):
+    """
+    Fetches and parses a legislator's detail page.
+
+    Args:
+        session (requests_cache.CachedSession): Shared HTTP session
+        limiter (RateLimiter): Shared rate limiter
+        link (str): URL of the legislator's detail page
+
+    Returns:
+        tuple: (committees, counties) where committees is a tuple of
+            (name, role) tuples and counties is a tuple of county names
+
+    Raises:
+        requests.exceptions.RequestException: If the HTTP request fails
+    """
+    committees = []
+    counties = []
+
+    # Be polite to the server with rate limiting (fresh cached pages don't hit it)
+    if not is_cached(session, link):
+        limiter.acquire()
+
+    # Fetch the individual legislator's detail page
+    detail_resp = session.get(link, timeout=REQUEST_TIMEOUT)
+    detail_resp.raise_for_status()
+    detail_tree = parse_html(detail_resp)
+
+    # Extract committee assignments and counties served
+    for elem in XP_DETAIL(detail_tree):
+        if 'committee-assignment' in elem.get('class', '').split():
+            cname_elems = XP_CNAME(elem)
+            role_elems = XP_ROLE(elem)
+            cname = cname_elems[0].text_content().strip() if cname_elems else ""
+            role = role_elems[0].text_content().strip() if role_elems else ""
+            if cname:
+                committees.append((cname, role))
+        else:
+            county = elem.text_content().strip()
+            if county:
+                counties.append(county)
+
+    return tuple(committees), tuple(counties)
+
+def fetch_legislator_details(session, limiter, name, link):
+    """
+    Fetches committee assignments and counties served from a legislator's detail page.
+
+    Args:
+        session (requests_cache.CachedSession): Shared HTTP session
+        limiter (RateLimiter): Shared rate limiter
+        name (str): Legislator's name, used for error reporting
+        link (str): URL of the legislator's detail page
+
+    Returns:
+        tuple: (committees, counties) where committees is a tuple of
+            (name, role) tuples and counties is a tuple of county names.
+            Both are empty if the page could not be fetched.
+    """
+    if link == "N/A":
+        return (), ()
+
+    try:
+        return parse_detail(session, limiter, link)
+    except Exception as e:
+        print(f"Error fetching details for {name}: {e}")
+        return (), ()
 
 def fetch_legislator_data(url):
     """
@@ -23,12 +218,14 @@ def fetch_legislator_data(url):
     This function scrapes the Colorado Legislature website to extract comprehensive
     information about each legislator including their district, chamber, name,
     party affiliation, personal website link, committee assignments, and counties served.
+    The main table is parsed first; the detail pages are then fetched concurrently.
 
     Args:
         url (str): The URL of the webpage to fetch (Colorado Legislature legislators page)
 
     Returns:
-        list of dict: Each dict contains legislator info with keys:
+        dict of list: Legislator info in columns, one list entry per legislator,
+        with keys:
             - District: District number (str)
             - Chamber: "Senate" or "House" (str)
             - Name: Legislator's full name (str)
@@ -41,104 +238,119 @@ def fetch_legislator_data(url):
         requests.exceptions.RequestException: If the HTTP request fails
         Exception: For other unexpected errors during scraping
     """
-    legislators_data = []
+    # Build the output column by column rather than as one dict per row
+    districts, chambers, names, parties, links = [], [], [], [], []
+    committees_col, counties_col = [], []
+    legislators_data = {
+        "District": districts,
+        "Chamber": chambers,
+        "Name": names,
+        "Party": parties,
+        "Link": links,
+        "Committees": committees_col,
+        "Counties": counties_col
+    }
     base_url = "https://leg.colorado.gov" # Base URL for constructing absolute links
 
+    session = create_session()
+
     try:
         # Fetch the main legislators page
-        response = requests.get(url)
+        response = session.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status() # Raise an HTTPError for bad responses (4xx or 5xx)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = parse_html(response)
 
         # Find the table by its ID
-        legislators_table = soup.find('table', id='legislators-overview-table')
+        legislators_tables = XP_TABLE(tree)
 
-        if not legislators_table:
+        if not legislators_tables:
             print("Error: Legislators table not found with ID 'legislators-overview-table'.")
-            return []
-
-        # Find all table rows within the tbody (excluding the header row)
-        tbody = legislators_table.find('tbody')
-        if tbody and isinstance(tbody, Tag):
-            table_rows = tbody.find_all('tr')
-        else:
-            table_rows = []
+            return legislators_data
 
-        # Process each legislator row
-        for row in table_rows:
-            cells = row.find_all('td')
+        # Process each legislator row within the tbody (excluding the header row)
+        for row in XP_ROWS(legislators_tables[0]):
+            cells = XP_CELLS(row)
             if len(cells) >= 4: # Ensure there are enough columns
                 # Extract chamber information
-                chamber_text = cells[0].get_text(strip=True)
+                chamber_text = cells[0].text_content()
                 chamber = "Senate" if "Senator" in chamber_text else "House"
 
                 # Extract name and link from the second column
-                name_elem = cells[1].find('a')
-                name = name_elem.get_text(strip=True) if name_elem else "N/A"
+                name_elems = XP_LINK(cells[1])
+                name = name_elems[0].text_content().strip() if name_elems else "N/A"
 
                 # Construct full URL for legislator's personal page
                 legislator_link = "N/A"
-                if name_elem and 'href' in name_elem.attrs:
-                    relative_link = name_elem['href']
+                relative_link = name_elems[0].get('href') if name_elems else None
+                if relative_link is not None:
                     if not relative_link.startswith('http'):
                         legislator_link = base_url + relative_link
                     else:
                         legislator_link = relative_link
 
                 # Extract district number from the third column
-                district_elem = cells[2].find('div', class_='field-content')
-                district = district_elem.get_text(strip=True) if district_elem else "N/A"
+                district_elems = XP_FIELD_CONTENT(cells[2])
+                district = district_elems[0].text_content().strip() if district_elems else "N/A"
 
                 # Extract party affiliation from the fourth column
-                party_elem = cells[3].find('div', class_='field-content')
-                party = party_elem.get_text(strip=True) if party_elem else "N/A"
-
-                # --- Fetch detail page for committees and counties ---
-                committees = []
-                counties = []
-                if legislator_link != "N/A":
-                    try:
-                        # Fetch the individual legislator's detail page
-                        detail_resp = requests.get(legislator_link)
-                        detail_resp.raise_for_status()
-                        detail_soup = BeautifulSoup(detail_resp.text, 'html.parser')
-                        
-                        # Extract committee assignments
-                        for cblock in detail_soup.select('.committee-assignment'):
-                            cname_elem = cblock.select_one('.committee-link a')
-                            role_elem = cblock.select_one('.committee-role span')
-                            cname = cname_elem.get_text(strip=True) if cname_elem else ""
-                            role = role_elem.get_text(strip=True) if role_elem else ""
-                            if cname:
-                                committees.append({"name": cname, "role": role})
-                        
-                        # Extract counties served
-                        for county_elem in detail_soup.select('.field-name-field-counties .field-item'):
-                            county = county_elem.get_text(strip=True)
-                            if county:
-                                counties.append(county)
-                        
-                        # Be polite to the server with rate limiting
-                        time.sleep(0.2)
-                    except Exception as e:
-                        print(f"Error fetching details for {name}: {e}")
-
-                # Add this legislator's data to our collection
-                legislators_data.append({
-                    "District": district,
-                    "Chamber": chamber,
-                    "Name": name,
-                    "Party": party,
-                    "Link": legislator_link,
-                    "Committees": committees,
-                    "Counties": counties
-                })
+                party_elems = XP_FIELD_CONTENT(cells[3])
+                party = party_elems[0].text_content().strip() if party_elems else "N/A"
+
+                # Committees and counties are filled in from the detail pages below
+                districts.append(district)
+                chambers.append(chamber)
+                names.append(name)
+                parties.append(party)
+                links.append(legislator_link)
+
+        # --- Fetch detail pages for committees and counties ---
+        # Each distinct page is fetched once, even if several rows link to it;
+        # every row still gets its own lists.
+        limiter = RateLimiter(REQUESTS_PER_SECOND, RATE_LIMIT_BURST)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {}
+            for name, link in zip(names, links):
+                if link not in futures:
+                    futures[link] = executor.submit(
+                        fetch_legislator_details, session, limiter, name, link)
+            for link in links:
+                committees, counties = futures[link].result()
+                committees_col.append([{"name": cname, "role": role} for cname, role in committees])
+                counties_col.append(list(counties))
     except requests.exceptions.RequestException as e:
         print(f"Error fetching data from {url}: {e}")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
+    finally:
+        session.close()
+
+    # Keep the columns the same length if scraping stopped before the detail pages
+    missing = len(names) - len(committees_col)
+    committees_col.extend([] for _ in range(missing))
+    counties_col.extend([] for _ in range(missing))
     return legislators_data
 
+def to_markdown(columns):
+    """
+    Formats column data as a Markdown table.
+
+    Args:
+        columns (dict of list): Column name to column values, all the same length
+
+    Returns:
+        str: Markdown table with one row per entry, padded to the widest value
+    """
+    headers = list(columns)
+    cells = [[str(value) for value in values] for values in columns.values()]
+    widths = [max([len(header), *map(len, column)]) for header, column in zip(headers, cells)]
+
+    def format_row(row):
+        return "| " + " | ".join(value.ljust(width) for value, width in zip(row, widths)) + " |"
+
+    lines = [format_row(headers), "|" + "|".join("-" * (width + 2) for width in widths) + "|"]
+    lines.extend(format_row(row) for row in zip(*cells))
+    return "\n".join(lines)
+
 # Main execution block
 if __name__ == "__main__":
     # URL of the webpage to fetch
@@ -149,24 +361,28 @@ if __name__ == "__main__":
     # Fetch the live webpage content
     fetched_data = fetch_legislator_data(target_url)
 
-    if fetched_data:
-        print(f"Successfully fetched data for {len(fetched_data)} legislators")
+    if fetched_data["Name"]:
+        print(f"Successfully fetched data for {len(fetched_data['Name'])} legislators")
         
-        # Convert to Pandas DataFrame for easy table creation and display
-        df = pd.DataFrame(fetched_data)
-
         # Print the Markdown table for verification
         print("\nLegislator Summary:")
-        print(df.to_markdown(index=False))
+        print(to_markdown(fetched_data))
 
         # Write the data to an external file as a json table that can be
         # read by a web application.
-        df.to_json('legislators.json', orient='records')
-        print(f"\nData saved to legislators.json")
+        # A gzipped copy is written alongside for servers that can send
+        # precompressed files (mtime=0 keeps the output reproducible).
+        records = [dict(zip(fetched_data, row)) for row in zip(*fetched_data.values())]
+        payload = orjson.dumps(records)
+        with open('legislators.json', 'wb') as file:
+            file.write(payload)
+        with open('legislators.json.gz', 'wb') as file:
+            file.write(gzip.compress(payload, compresslevel=9, mtime=0))
+        print(f"\nData saved to legislators.json and legislators.json.gz")
 
         # Read the data from the file and print it for verification
-        with open('legislators.json', 'r') as file:
-            data = json.load(file)
+        with open('legislators.json', 'rb') as file:
+            data = orjson.loads(file.read())
         print(f"Verified: {len(data)} records written to file")
     else:
         print("No data was fetched. Please check the website and try again.")